@@ -7,12 +7,45 @@ and executes models in Docker containers.
 """
 
 from flask import Flask, render_template, request, jsonify, redirect, url_for
+from flask.json.provider import JSONProvider
+from jinja2 import FileSystemBytecodeCache
 from metadata_handler import MetadataHandler
 from docker_executor import DockerExecutor
+from batching_scheduler import BatchingScheduler
+import atexit
 import logging
+import math
+import orjson
+import os
+import threading
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson."""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS),
+            mimetype='application/json'
+        )
+
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'dev-secret-key-change-in-production'
+app.json = OrjsonProvider(app)
+
+# Compile templates once and cache the compiled bytecode on disk; templates are
+# only reloaded on change in debug mode
+app.jinja_env.bytecode_cache = FileSystemBytecodeCache()
+for template_name in ['index.html', 'model_form.html', 'result.html', 'error.html']:
+    app.jinja_env.get_template(template_name)
 
 # Configure logging
 logging.basicConfig(
@@ -21,6 +54,47 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Keep connection-pool chatter from the pooled HTTP sessions out of the logs
+logging.getLogger('urllib3').setLevel(logging.WARNING)
+
+# Shared across requests so fetched metadata stays cached
+metadata_handler = MetadataHandler()
+
+# One executor is shared by all requests, so the Docker client, network
+# detection and warm containers are set up once. It is created on first use
+# so the app still starts when Docker is unavailable.
+_docker_executor = None
+_batching_scheduler = None
+_docker_executor_lock = threading.Lock()
+
+
+def get_docker_executor() -> DockerExecutor:
+    """Return the shared DockerExecutor, creating it on first use."""
+    global _docker_executor
+    with _docker_executor_lock:
+        if _docker_executor is None:
+            _docker_executor = DockerExecutor(
+                max_warm_containers=int(os.environ.get('MAX_WARM_CONTAINERS', 4)),
+                idle_timeout=int(os.environ.get('CONTAINER_IDLE_TIMEOUT', 300))
+            )
+            atexit.register(_docker_executor.cleanup)
+        return _docker_executor
+
+
+def get_batching_scheduler() -> BatchingScheduler:
+    """Return the shared BatchingScheduler, creating it on first use."""
+    global _batching_scheduler
+    docker_executor = get_docker_executor()
+    with _docker_executor_lock:
+        if _batching_scheduler is None:
+            _batching_scheduler = BatchingScheduler(
+                docker_executor,
+                max_batch_size=int(os.environ.get('BATCH_MAX_SIZE', 1)),
+                batch_delay_ms=float(os.environ.get('BATCH_DELAY_MS', 10)),
+                max_concurrent_batches=int(os.environ.get('BATCH_MAX_CONCURRENT', 16))
+            )
+        return _batching_scheduler
+
 
 def extract_model_id(model_id_or_url: str) -> str:
     """
@@ -40,18 +114,71 @@ def extract_model_id(model_id_or_url: str) -> str:
     return model_id_or_url
 
 
+def _finite_float(value: str) -> float:
+    """Convert to float, rejecting 'nan', 'inf' and overflowing values like '1e999'."""
+    number = float(value)
+    if not math.isfinite(number):
+        # These would be serialized as null and reach the model as a missing value
+        raise ValueError(f"Not a finite number: {value}")
+    return number
+
+
+# Converters from submitted form strings to the declared variable type
+_COERCERS = {
+    'number': _finite_float,
+    'integer': int,
+    'boolean': lambda value: value.strip().lower() in ('true', '1', 'yes', 'on'),
+}
+
+
+def coerce_input(input_data: dict, variable_types: dict) -> dict:
+    """
+    Convert form values to the types declared in the model metadata.
+    
+    Values that are not strings, have no known type, or fail to convert are
+    passed through unchanged.
+    
+    Args:
+        input_data: Submitted form values
+        variable_types: Mapping of variable name to declared type
+        
+    Returns:
+        Dictionary with the converted values
+    """
+    typed = {}
+    for name, value in input_data.items():
+        coerce = _COERCERS.get(variable_types.get(name))
+        if coerce and isinstance(value, str) and value != '':
+            try:
+                value = coerce(value)
+            except ValueError:
+                pass
+        typed[name] = value
+    return typed
+
+
 @app.route('/')
 def index():
     """Landing page with option to enter model ID."""
     try:
-        metadata_handler = MetadataHandler()
         models = metadata_handler.fetch_models_list()
         return render_template('index.html', models=models)
     except Exception as e:
-        logger.error(f"Error fetching models list: {str(e)}")
+        logger.error("Error fetching models list: %s", e)
         return render_template('index.html', models=[])
 
 
+@app.route('/healthz')
+def healthz():
+    """Readiness probe: reports whether the Docker daemon is reachable."""
+    try:
+        get_docker_executor().client.ping()
+        return jsonify({'status': 'ok'})
+    except Exception as e:
+        logger.error("Health check failed: %s", e)
+        return jsonify({'status': 'error', 'error': str(e)}), 503
+
+
 @app.route('/model/<model_id>')
 def model_form(model_id):
     """
@@ -64,26 +191,27 @@ def model_form(model_id):
         # Extract UUID if a full URL was provided
         model_id = extract_model_id(model_id)
         
-        metadata_handler = MetadataHandler()
-        metadata = metadata_handler.fetch_metadata(model_id)
+        model_info = metadata_handler.get_model_info(model_id)
         
-        if not metadata:
+        if not model_info:
             return render_template('error.html', 
                                  error="Could not fetch model metadata"), 404
         
-        # Extract variable information for form generation
-        variables = metadata_handler.extract_variables(metadata)
-        model_name = metadata_handler.get_model_name(metadata)
-        docker_image = metadata_handler.get_docker_image(metadata)
+        # Pull the image in the background while the user fills in the form
+        if model_info.docker_image:
+            try:
+                get_docker_executor().prefetch(model_info.docker_image)
+            except Exception as e:
+                logger.warning("Could not prefetch image %s: %s", model_info.docker_image, e)
         
         return render_template('model_form.html',
                              model_id=model_id,
-                             model_name=model_name,
-                             variables=variables,
-                             docker_image=docker_image)
+                             model_name=model_info.name,
+                             variables=model_info.variables,
+                             docker_image=model_info.docker_image)
     
     except Exception as e:
-        logger.error(f"Error loading model {model_id}: {str(e)}")
+        logger.error("Error loading model %s: %s", model_id, e)
         return render_template('error.html', 
                              error=f"Error loading model: {str(e)}"), 500
 
@@ -100,20 +228,20 @@ def perform_inference(model_id):
         # Extract UUID if a full URL was provided
         model_id = extract_model_id(model_id)
         
-        # Get form data
-        input_data = request.form.to_dict()
+        # Look up the Docker image and variable types (cached after the form was rendered)
+        model_info = metadata_handler.get_model_info(model_id)
+        docker_image = model_info.docker_image if model_info else None
         
-        # Fetch metadata to get Docker image
-        metadata_handler = MetadataHandler()
-        metadata = metadata_handler.fetch_metadata(model_id)
-        docker_image = metadata_handler.get_docker_image(metadata)
+        # Get form data, converted to the declared variable types
+        input_data = coerce_input(request.form.to_dict(),
+                                  model_info.variable_types if model_info else {})
         
         if not docker_image:
             return jsonify({'error': 'Docker image not found in metadata'}), 400
         
         # Execute inference in Docker container
-        docker_executor = DockerExecutor()
-        result = docker_executor.run_inference(docker_image, input_data)
+        scheduler = get_batching_scheduler()
+        result = scheduler.submit(docker_image, input_data)
         
         return render_template('result.html',
                              model_id=model_id,
@@ -121,7 +249,7 @@ def perform_inference(model_id):
                              result=result)
     
     except Exception as e:
-        logger.error(f"Error performing inference for {model_id}: {str(e)}")
+        logger.error("Error performing inference for %s: %s", model_id, e)
         return render_template('error.html', 
                              error=f"Inference error: {str(e)}"), 500
 
@@ -144,17 +272,15 @@ def api_inference(model_id):
         if not input_data:
             return jsonify({'error': 'No input data provided'}), 400
         
-        # Fetch metadata to get Docker image
-        metadata_handler = MetadataHandler()
-        metadata = metadata_handler.fetch_metadata(model_id)
-        docker_image = metadata_handler.get_docker_image(metadata)
+        # Look up only the Docker image
+        docker_image = metadata_handler.get_docker_image_by_id(model_id)
         
         if not docker_image:
             return jsonify({'error': 'Docker image not found in metadata'}), 400
         
         # Execute inference in Docker container
-        docker_executor = DockerExecutor()
-        result = docker_executor.run_inference(docker_image, input_data)
+        scheduler = get_batching_scheduler()
+        result = scheduler.submit(docker_image, input_data)
         
         return jsonify({
             'model_id': model_id,
@@ -164,7 +290,7 @@ def api_inference(model_id):
         })
     
     except Exception as e:
-        logger.error(f"API inference error for {model_id}: {str(e)}")
+        logger.error("API inference error for %s: %s", model_id, e)
         return jsonify({
             'error': str(e),
             'status': 'error'
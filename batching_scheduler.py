@@ -0,0 +1,155 @@
+"""
+Batching Scheduler Module
+
+Groups concurrent inference requests for the same Docker image into a single
+batched request to the model container.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Set
+
+from docker_executor import DockerExecutor, PredictionRequestError
+
+logger = logging.getLogger(__name__)
+
+
+class _PendingRequest:
+    """An inference request waiting for its batch to complete."""
+    
+    __slots__ = ('input_data', 'event', 'result', 'error')
+    
+    def __init__(self, input_data: Dict[str, Any]):
+        self.input_data = input_data
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class BatchingScheduler:
+    """
+    Micro-batches inference requests per Docker image.
+    
+    Batching is opt-in: it needs model servers that accept a list of inputs,
+    so with the default max_batch_size of 1 requests run directly.
+    """
+    
+    def __init__(self, executor: DockerExecutor, max_batch_size: int = 1,
+                 batch_delay_ms: float = 10, max_concurrent_batches: int = 16):
+        """
+        Initialize the scheduler.
+        
+        Args:
+            executor: The DockerExecutor used to run the model containers
+            max_batch_size: Maximum number of inputs sent to the model at once;
+                1 disables batching
+            batch_delay_ms: How long to wait for more requests before sending a batch
+            max_concurrent_batches: Maximum number of batches in flight across all images
+        """
+        self.executor = executor
+        self.max_batch_size = max(1, max_batch_size)
+        self.batch_delay = batch_delay_ms / 1000
+        
+        # Batches run on a shared pool so a worker can keep collecting requests
+        # while earlier batches are still waiting on their containers
+        self._dispatch = ThreadPoolExecutor(
+            max_workers=max(1, max_concurrent_batches),
+            thread_name_prefix='batch'
+        )
+        self._queues: Dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+        
+        # Images whose model server rejected a batched request
+        self._unbatchable: Set[str] = set()
+    
+    def submit(self, docker_image: str, input_data: Dict[str, Any]) -> Any:
+        """
+        Queue an inference request and block until its result is available.
+        
+        Args:
+            docker_image: The Docker image URL/name
+            input_data: Dictionary containing input variable values
+            
+        Returns:
+            The inference result
+        """
+        if self.max_batch_size == 1 or docker_image in self._unbatchable:
+            # Nothing to batch; run in the calling thread without queueing
+            return self.executor.run_inference(docker_image, input_data)
+        
+        pending = _PendingRequest(input_data)
+        self._get_queue(docker_image).put(pending)
+        pending.event.wait()
+        
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+    
+    def _get_queue(self, docker_image: str) -> queue.Queue:
+        """Return the queue for an image, starting its worker thread on first use."""
+        with self._lock:
+            image_queue = self._queues.get(docker_image)
+            if image_queue is None:
+                image_queue = queue.Queue()
+                self._queues[docker_image] = image_queue
+                worker = threading.Thread(
+                    target=self._worker,
+                    args=(docker_image, image_queue),
+                    name=f"batcher-{docker_image}",
+                    daemon=True
+                )
+                worker.start()
+            return image_queue
+    
+    def _worker(self, docker_image: str, image_queue: queue.Queue) -> None:
+        """Collect queued requests into batches and run them."""
+        while True:
+            batch = [image_queue.get()]
+            
+            # Give concurrent requests a short window to join the batch
+            try:
+                while len(batch) < self.max_batch_size:
+                    batch.append(image_queue.get(timeout=self.batch_delay))
+                    while len(batch) < self.max_batch_size:
+                        batch.append(image_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            self._dispatch.submit(self._run_batch, docker_image, batch)
+    
+    def _run_batch(self, docker_image: str, batch: List[_PendingRequest]) -> None:
+        """
+        Run a batch and hand each result back to its waiting request.
+        
+        Concurrent batches for the same image each get their own container from
+        the executor, so their /status polling overlaps.
+        """
+        if len(batch) > 1 and docker_image not in self._unbatchable:
+            try:
+                results = self.executor.run_batch_inference(
+                    docker_image, [pending.input_data for pending in batch]
+                )
+                for pending, result in zip(batch, results):
+                    pending.result = result
+                    pending.event.set()
+                return
+            except Exception as e:
+                logger.warning(
+                    "Batched inference failed for %s, falling back to single requests: %s",
+                    docker_image, e
+                )
+                # Only an HTTP 4xx answer to the list payload shows that the
+                # model server doesn't take batches; other errors may be
+                # transient or caused by a single input
+                if isinstance(e, PredictionRequestError) and 400 <= e.status_code < 500:
+                    self._unbatchable.add(docker_image)
+        
+        for pending in batch:
+            try:
+                pending.result = self.executor.run_inference(docker_image, pending.input_data)
+            except Exception as e:
+                pending.error = e
+            finally:
+                pending.event.set()
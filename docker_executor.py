@@ -8,30 +8,127 @@ Based on the FAIVOR ML Validator approach.
 import docker
 import json
 import logging
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import socket
+import threading
+import hashlib
+import uuid
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Dict, Any, Optional, List
 
 logger = logging.getLogger(__name__)
 
+# How long a model server may hold a /status?wait=N long-poll request open
+STATUS_LONG_POLL_SECONDS = 5
+
+# How long a model server may hold a /predict_sync?wait=N request open
+PREDICT_SYNC_WAIT_SECONDS = 2
+
+# Connections kept open to the Docker daemon
+DOCKER_MAX_POOL_SIZE = 32
+
+# Host ports handed out to model containers when running outside Docker
+HOST_PORT_RANGE = range(40000, 40100)
+
+# Container start attempts when a host port is taken; the last uses a random port
+HOST_PORT_ATTEMPTS = 3
+
+# Docker's built-in networks, which have no embedded DNS for container names
+BUILTIN_NETWORKS = {'bridge', 'host', 'none'}
+
+
+class ModelPredictionError(Exception):
+    """The model server ran the prediction and reported it as failed (status 4)."""
+
+
+class PredictionRequestError(Exception):
+    """The model server answered a prediction request with an HTTP error."""
+    
+    def __init__(self, status_code: int, message: str):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _rejected_input(error: Exception) -> bool:
+    """Whether the model server is healthy but rejected the input (status 4 or HTTP 4xx)."""
+    if isinstance(error, PredictionRequestError):
+        return 400 <= error.status_code < 500
+    return isinstance(error, ModelPredictionError)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff for polling: 10 ms, growing by 1.5x, capped at 250 ms."""
+    return min(0.25, 0.01 * 1.5 ** attempt)
+
 
 class DockerExecutor:
     """Handles Docker container execution for model inference."""
     
-    def __init__(self):
-        """Initialize Docker client."""
+    def __init__(self, max_warm_containers: int = 4, idle_timeout: int = 300):
+        """
+        Initialize Docker client.
+        
+        Args:
+            max_warm_containers: Maximum number of idle containers kept running for reuse
+            idle_timeout: Seconds after which an idle warm container is stopped
+        """
+        # Warm container pool: image -> (container, base_url, last_used), in LRU order
+        self.max_warm_containers = max_warm_containers
+        self.idle_timeout = idle_timeout
+        self._warm: "OrderedDict[str, tuple]" = OrderedDict()
+        self._warm_lock = threading.Lock()
+        self._reaper: Optional[threading.Timer] = None
+        
+        # Images known to be available locally, so the daemon isn't asked again
+        self._known_images: set = set()
+        
+        # Background image pulls, deduplicated per image. The lock also guards
+        # _known_images since the executor is shared between request threads.
+        self._pull_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='image-pull')
+        self._pulling: Dict[str, Future] = {}
+        self._pulling_lock = threading.Lock()
+        
+        # Host ports for model containers, returned to the pool when they stop
+        self._port_pool = deque(HOST_PORT_RANGE)
+        self._host_ports: Dict[str, int] = {}
+        
+        # Images whose model server rejected the /status?wait= long-poll
+        # parameter or doesn't implement /predict_sync
+        self._no_long_poll: set = set()
+        self._no_predict_sync: set = set()
+        
+        # Pooled keep-alive HTTP session for talking to the model servers
+        self.http = requests.Session()
+        self.http.mount('http://', HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=0)
+        ))
+        self.http.headers.update({
+            'Connection': 'keep-alive',
+            'Content-Type': 'application/json'
+        })
+        
         try:
-            self.client = docker.from_env()
+            # Keep enough pooled keep-alive connections to the daemon for the
+            # concurrent pulls, probes and log followers
+            self.client = docker.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
+            # Low-level API client sharing the same connection pool
+            self.api = self.client.api
             # Test connection
             self.client.ping()
             logger.info("Docker client initialized successfully")
             
             # Detect current container's network(s)
             self.networks = self._detect_current_networks()
-            logger.info(f"Detected networks: {self.networks}")
+            logger.info("Detected networks: %s", self.networks)
         except docker.errors.DockerException as e:
-            logger.error(f"Failed to initialize Docker client: {str(e)}")
+            logger.error("Failed to initialize Docker client: %s", e)
             logger.error("Please ensure Docker is installed and running")
             logger.error("You may need to run: sudo systemctl start docker")
             raise Exception(
@@ -39,7 +136,7 @@ class DockerExecutor:
                 "You may need to start the Docker service or check permissions."
             )
         except Exception as e:
-            logger.error(f"Unexpected error initializing Docker client: {str(e)}")
+            logger.error("Unexpected error initializing Docker client: %s", e)
             raise
     
     def _detect_current_networks(self) -> List[str]:
@@ -50,22 +147,22 @@ class DockerExecutor:
         try:
             # Get current hostname (container ID when running in a container)
             hostname = socket.gethostname()
-            logger.info(f"Current hostname: {hostname}")
+            logger.info("Current hostname: %s", hostname)
             
             # Try to find this container
             try:
-                container = self.client.containers.get(hostname)
-                networks = list(container.attrs['NetworkSettings']['Networks'].keys())
-                logger.info(f"Found current container {hostname} in networks: {networks}")
+                attrs = self.api.inspect_container(hostname)
+                networks = list(attrs['NetworkSettings']['Networks'].keys())
+                logger.info("Found current container %s in networks: %s", hostname, networks)
                 return networks
             except docker.errors.NotFound:
                 logger.info("Not running inside a container, or container not found")
                 return []
             except Exception as e:
-                logger.warning(f"Could not detect container networks: {str(e)}")
+                logger.warning("Could not detect container networks: %s", e)
                 return []
         except Exception as e:
-            logger.warning(f"Error detecting networks: {str(e)}")
+            logger.warning("Error detecting networks: %s", e)
             return []
     
     def run_inference(self, docker_image: str, input_data: Dict[str, Any]) -> Any:
@@ -79,13 +176,127 @@ class DockerExecutor:
         Returns:
             The inference result
         """
-        logger.info(f"Starting inference with image: {docker_image}")
-        logger.info(f"Input data: {input_data}")
+        logger.info("Starting inference with image: %s", docker_image)
+        logger.info("Input data: %s", input_data)
+        
+        container, base_url, reused = self._acquire_container(docker_image)
+        try:
+            # Make HTTP request to the model
+            result = self._make_inference_request(docker_image, base_url, input_data)
+        except Exception as e:
+            if _rejected_input(e):
+                # The model rejected this input; the container itself is fine
+                self._release_container(docker_image, container, base_url)
+                raise
+            logger.error("Error during inference: %s", e)
+            # Only a warm container that can no longer be reached is worth
+            # replacing; other failures would just repeat on a fresh one
+            retry = reused and self._is_unreachable(e, container)
+            # Don't reuse a container that may be in a bad state
+            self._stop_container(container)
+            if not retry:
+                raise
+            
+            # The warm container died while idle; retry once on a fresh one
+            logger.info("Retrying inference with a fresh container")
+            container, base_url, _ = self._acquire_container(docker_image, use_warm=False)
+            try:
+                result = self._make_inference_request(docker_image, base_url, input_data)
+            except Exception as e:
+                if _rejected_input(e):
+                    self._release_container(docker_image, container, base_url)
+                else:
+                    self._stop_container(container)
+                raise
+        
+        self._release_container(docker_image, container, base_url)
+        return result
+    
+    def _is_unreachable(self, error: Exception, container) -> bool:
+        """
+        Check whether an inference failed because its container's server is gone.
+        
+        Args:
+            error: The error raised by the inference request
+            container: The container the request was sent to
+            
+        Returns:
+            True on a connection error or when the container is no longer running
+        """
+        if isinstance(error.__cause__, requests.exceptions.ConnectionError):
+            return True
+        try:
+            container.reload()
+            return container.status != 'running'
+        except docker.errors.NotFound:
+            return True
+        except Exception as e:
+            logger.warning("Could not check container %s: %s", container.id[:12], e)
+            return False
+    
+    def run_batch_inference(self, docker_image: str, inputs: List[Dict[str, Any]]) -> List[Any]:
+        """
+        Run inference for several inputs with a single request to the model.
+        
+        The inputs are posted to /predict as a JSON list and the model is expected
+        to return a list of results in the same order.
+        
+        Args:
+            docker_image: The Docker image URL/name
+            inputs: List of input dictionaries
+            
+        Returns:
+            List of inference results, one per input
+        """
+        logger.info("Starting batch inference of %s inputs with image: %s", len(inputs), docker_image)
+        
+        container, base_url, _ = self._acquire_container(docker_image)
+        try:
+            results = self._make_inference_request(docker_image, base_url, inputs)
+        except Exception as e:
+            logger.error("Error during batch inference: %s", e)
+            if _rejected_input(e):
+                # The server rejected the list payload or one of its inputs but
+                # is otherwise fine, so keep the container
+                self._release_container(docker_image, container, base_url)
+            else:
+                self._stop_container(container)
+            raise
+        
+        self._release_container(docker_image, container, base_url)
+        if not isinstance(results, list) or len(results) != len(inputs):
+            raise Exception("Model did not return one result per batched input")
+        return results
+    
+    def _acquire_container(self, docker_image: str, use_warm: bool = True):
+        """
+        Take a warm container for the image from the pool, or start a new one.
+        
+        A container is used by one inference at a time; concurrent requests for
+        the same image get their own container.
+        
+        Args:
+            docker_image: The Docker image URL/name
+            use_warm: Whether a warm container from the pool may be used
+            
+        Returns:
+            Tuple of (container, base_url, reused)
+        """
+        entry = None
+        if use_warm:
+            with self._warm_lock:
+                entry = self._warm.pop(docker_image, None)
+        
+        if entry:
+            container, base_url, _ = entry
+            logger.info("Reusing warm container %s for %s", container.id[:12], docker_image)
+            return container, base_url, True
         
         container = None
         try:
-            # Pull the Docker image
-            self._pull_image(docker_image)
+            # Pull the Docker image, or wait for a pull already in progress
+            if docker_image not in self._known_images:
+                self._ensure_image(docker_image).result()
             
             # Run the container with HTTP server
             container = self._start_container(docker_image)
@@ -93,24 +304,107 @@ class DockerExecutor:
             # Wait for the server to be ready
             base_url = self._wait_for_server(container)
             
-            # Make HTTP request to the model
-            result = self._make_inference_request(base_url, input_data)
-            
-            return result
+            return container, base_url, False
             
         except Exception as e:
-            logger.error(f"Error during inference: {str(e)}")
+            logger.error("Error during inference: %s", e)
+            if isinstance(e, docker.errors.ImageNotFound):
+                # The image was removed since we last checked
+                with self._pulling_lock:
+                    self._known_images.discard(docker_image)
+            if container:
+                self._stop_container(container)
             raise
+    
+    def _release_container(self, docker_image: str, container, base_url: str) -> None:
+        """
+        Return a container to the warm pool after a successful inference.
+        
+        Evicts the least recently used containers when the pool is full.
+        """
+        evicted = []
+        with self._warm_lock:
+            if docker_image in self._warm or self.max_warm_containers <= 0:
+                # Another container for this image is already warm
+                evicted.append(container)
+            else:
+                self._warm[docker_image] = (container, base_url, time.monotonic())
+                while len(self._warm) > self.max_warm_containers:
+                    _, (old_container, _, _) = self._warm.popitem(last=False)
+                    evicted.append(old_container)
+            self._schedule_reaper()
+        
+        for old_container in evicted:
+            self._stop_container(old_container)
+    
+    def _schedule_reaper(self) -> None:
+        """Start the idle-container timer if it is not already pending. Caller holds the lock."""
+        if self._reaper is None and self._warm:
+            self._reaper = threading.Timer(max(1, self.idle_timeout / 2), self._reap_idle)
+            self._reaper.daemon = True
+            self._reaper.start()
+    
+    def _reap_idle(self) -> None:
+        """Stop warm containers that have been idle longer than idle_timeout."""
+        now = time.monotonic()
+        idle = []
+        with self._warm_lock:
+            self._reaper = None
+            for image, (container, _, last_used) in list(self._warm.items()):
+                if now - last_used >= self.idle_timeout:
+                    del self._warm[image]
+                    idle.append(container)
+            self._schedule_reaper()
+        
+        for container in idle:
+            self._stop_container(container)
+    
+    def _stop_container(self, container) -> None:
+        """Stop and remove a container, logging rather than raising on failure."""
+        host_port = self._host_ports.pop(container.id, None)
+        try:
+            logger.info("Stopping container %s", container.id[:12])
+            container.stop(timeout=5)
+            container.remove()
+            logger.info("Container stopped and removed")
+        except Exception as e:
+            logger.warning("Error cleaning up container: %s", e)
         finally:
-            # Clean up: stop and remove container
-            if container:
-                try:
-                    logger.info(f"Stopping container {container.id[:12]}")
-                    container.stop(timeout=5)
-                    container.remove()
-                    logger.info("Container stopped and removed")
-                except Exception as e:
-                    logger.warning(f"Error cleaning up container: {str(e)}")
+            if host_port is not None:
+                self._port_pool.append(host_port)
+    
+    def prefetch(self, docker_image: str) -> Future:
+        """
+        Start pulling an image in the background so it is local before inference.
+        
+        Args:
+            docker_image: The Docker image URL/name
+            
+        Returns:
+            A Future that completes when the image is available
+        """
+        return self._ensure_image(docker_image)
+    
+    def _ensure_image(self, image_name: str) -> Future:
+        """Return the pull in progress for an image, submitting one if there is none."""
+        with self._pulling_lock:
+            future = self._pulling.get(image_name)
+            if future is None:
+                future = self._pull_executor.submit(self._pull_image, image_name)
+                self._pulling[image_name] = future
+                future.add_done_callback(lambda f: self._forget_pull(image_name, f))
+            return future
+    
+    def _forget_pull(self, image_name: str, future: Future) -> None:
+        """Drop a finished pull so later requests check the image again."""
+        with self._pulling_lock:
+            if self._pulling.get(image_name) is future:
+                del self._pulling[image_name]
+    
+    def _mark_image_known(self, image_name: str) -> None:
+        """Record that an image is available locally."""
+        with self._pulling_lock:
+            self._known_images.add(image_name)
     
     def _pull_image(self, image_name: str) -> None:
         """
@@ -119,23 +413,34 @@ class DockerExecutor:
         Args:
             image_name: The Docker image name/URL
         """
+        if image_name in self._known_images:
+            return
+        
         try:
-            logger.info(f"Checking for image: {image_name}")
+            logger.info("Checking for image: %s", image_name)
             # Check if image exists locally
             try:
-                self.client.images.get(image_name)
-                logger.info(f"Image {image_name} already available locally")
+                self.api.inspect_image(image_name)
+                logger.info("Image %s already available locally", image_name)
+                self._mark_image_known(image_name)
                 return
             except docker.errors.ImageNotFound:
                 pass
             
-            # Pull the image
-            logger.info(f"Pulling image: {image_name}")
-            self.client.images.pull(image_name)
-            logger.info(f"Successfully pulled image: {image_name}")
+            # Pull the image, draining the raw progress stream without decoding
+            # every line; only chunks reporting an error are parsed
+            logger.info("Pulling image: %s", image_name)
+            for chunk in self.api.pull(image_name, stream=True, decode=False):
+                if b'"error"' in chunk:
+                    for line in chunk.splitlines():
+                        if b'"error"' in line:
+                            message = json.loads(line).get('error')
+                            raise docker.errors.APIError(f"Pull failed: {message}")
+            logger.info("Successfully pulled image: %s", image_name)
+            self._mark_image_known(image_name)
         
         except Exception as e:
-            logger.error(f"Failed to pull image {image_name}: {str(e)}")
+            logger.error("Failed to pull image %s: %s", image_name, e)
             raise
     
     def _start_container(self, image_name: str):
@@ -149,45 +454,109 @@ class DockerExecutor:
             The running container object
         """
         try:
-            logger.info(f"Starting container with image: {image_name}")
+            logger.info("Starting container with image: %s", image_name)
             
             # Determine network configuration
             network_config = None
             if self.networks:
                 # Use the first detected network
                 network_config = self.networks[0]
-                logger.info(f"Connecting model container to network: {network_config}")
-            
-            # Start container in detached mode with port mapping
-            container = self.client.containers.run(
-                image_name,
-                detach=True,
-                ports={'8000/tcp': None},  # Map to random host port
-                network=network_config,  # Connect to same network
-                remove=False,  # We'll remove it manually
-                mem_limit='1g',
-                cpu_period=100000,
-                cpu_quota=50000
-            )
+                logger.info("Connecting model container to network: %s", network_config)
+            
+            # Choose the name and host port up front so the server address is
+            # known without inspecting the container
+            name = self._name_for(image_name)
+            
+            # Create and start the container with the low-level API; unlike
+            # containers.run() this doesn't inspect the container afterwards.
+            # A host port from the pool may be held by another process, so on a
+            # failed start try the next one, and finally a random port.
+            for attempt in range(HOST_PORT_ATTEMPTS):
+                host_port = None
+                if not self.networks and self._port_pool and attempt < HOST_PORT_ATTEMPTS - 1:
+                    host_port = self._port_pool.popleft()
+                
+                container_id = None
+                try:
+                    host_config = self.api.create_host_config(
+                        port_bindings={8000: host_port},  # None maps to a random host port
+                        network_mode=network_config,  # Connect to same network
+                        mem_limit='1g',
+                        cpu_period=100000,
+                        cpu_quota=50000
+                    )
+                    container_id = self.api.create_container(
+                        image=image_name,
+                        name=name,
+                        ports=[8000],
+                        host_config=host_config
+                    )['Id']
+                    self.api.start(container_id)
+                    break
+                except Exception as e:
+                    if container_id is not None:
+                        self._remove_created(container_id)
+                    if host_port is None:
+                        raise
+                    # Back of the queue, in case whatever holds it lets go later
+                    self._port_pool.append(host_port)
+                    if container_id is None:
+                        raise
+                    logger.warning("Could not start container on host port %s, retrying: %s", host_port, e)
             
-            logger.info(f"Container started with ID: {container.id[:12]}")
+            if host_port is not None:
+                self._host_ports[container_id] = host_port
+            
+            # Attributes are loaded later, only if the server address isn't known
+            container = self.client.containers.prepare_model({'Id': container_id, 'Name': name})
+            
+            logger.info("Container started with ID: %s", container.id[:12])
             
             # Connect to additional networks if present
             if len(self.networks) > 1:
                 for network in self.networks[1:]:
                     try:
-                        network_obj = self.client.networks.get(network)
-                        network_obj.connect(container)
-                        logger.info(f"Connected container to additional network: {network}")
+                        self.api.connect_container_to_network(container_id, network)
+                        logger.info("Connected container to additional network: %s", network)
                     except Exception as e:
-                        logger.warning(f"Could not connect to network {network}: {str(e)}")
+                        logger.warning("Could not connect to network %s: %s", network, e)
             
             return container
             
         except Exception as e:
-            logger.error(f"Failed to start container: {str(e)}")
+            logger.error("Failed to start container: %s", e)
             raise
     
+    def _remove_created(self, container_id: str) -> None:
+        """Remove a container that was created but could not be started."""
+        try:
+            self.api.remove_container(container_id, force=True)
+        except Exception as e:
+            logger.warning("Error removing container %s: %s", container_id[:12], e)
+    
+    def _name_for(self, image_name: str) -> str:
+        """Generate a unique container name for an image: fairmodels-<image hash>-<suffix>."""
+        image_hash = hashlib.sha1(image_name.encode('utf-8')).hexdigest()[:12]
+        return f"fairmodels-{image_hash}-{uuid.uuid4().hex[:8]}"
+    
+    def _known_base_url(self, container) -> Optional[str]:
+        """
+        Derive the server URL from the container's name or assigned host port.
+        
+        Returns:
+            The base URL, or None if the container has to be inspected to find it
+        """
+        if self.networks:
+            # Containers on user-defined networks are resolvable by name
+            if self.networks[0] not in BUILTIN_NETWORKS and container.name:
+                return f"http://{container.name}:8000"
+            return None
+        
+        host_port = self._host_ports.get(container.id)
+        if host_port is not None:
+            return f"http://localhost:{host_port}"
+        return None
+    
     def _wait_for_server(self, container, timeout: int = 60) -> str:
         """
         Wait for the server inside the container to be ready.
@@ -199,76 +568,155 @@ class DockerExecutor:
         Returns:
             The base URL where the server is accessible (either container IP or localhost:port)
         """
-        # Reload container to get network information
-        container.reload()
-        
-        # Determine the base URL based on whether we're running in a container
-        base_url = None
-        if self.networks:
+        base_url = self._known_base_url(container)
+        if base_url:
+            logger.info("Using known container address: %s", base_url)
+        elif self.networks:
+            # Reload container to get network information
+            container.reload()
+            
             # We're running in a container - use container's internal network address
             network_name = self.networks[0]
             network_settings = container.attrs['NetworkSettings']['Networks'].get(network_name)
             if network_settings and network_settings.get('IPAddress'):
                 container_ip = network_settings['IPAddress']
                 base_url = f"http://{container_ip}:8000"
-                logger.info(f"Using container internal address: {base_url}")
+                logger.info("Using container internal address: %s", base_url)
             else:
                 # Fallback: use container name or ID
                 container_name = container.name
                 base_url = f"http://{container_name}:8000"
-                logger.info(f"Using container name: {base_url}")
+                logger.info("Using container name: %s", base_url)
         else:
             # Running locally - use localhost with mapped port
+            container.reload()
             port_mapping = container.ports.get('8000/tcp')
             if not port_mapping:
                 raise Exception("Container did not expose port 8000")
             host_port = int(port_mapping[0]['HostPort'])
             base_url = f"http://localhost:{host_port}"
-            logger.info(f"Using localhost with mapped port: {base_url}")
+            logger.info("Using localhost with mapped port: %s", base_url)
         
-        # Wait for server to be ready
-        start_time = time.time()
-        last_error = None
+        # Follow the container logs in the background for error reporting
+        log_tail, log_thread, stop_logs = self._tail_logs(container)
         
-        while time.time() - start_time < timeout:
-            try:
-                # Try multiple endpoints to check if server is up
-                for endpoint in ['/health', '/docs', '/']:
-                    try:
-                        response = requests.get(
-                            f"{base_url}{endpoint}", 
-                            timeout=2
-                        )
-                        # Any response (even 404) means server is running
-                        if response.status_code in [200, 404, 405]:
-                            logger.info(f"Server is ready (checked {endpoint})")
-                            return base_url
-                    except requests.exceptions.RequestException as e:
-                        last_error = str(e)
-                        continue
-            except Exception as e:
-                last_error = str(e)
+        # One probe thread per endpoint for this wait only, so concurrent cold
+        # starts don't queue behind each other's probes
+        probe_executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix='probe')
+        
+        try:
+            # Wait for server to be ready
+            start_time = time.time()
+            last_error = None
+            attempt = 0
+            futures = {}
             
-            # Check if container is still running
-            container.reload()
-            if container.status != 'running':
-                logs = container.logs().decode('utf-8')
-                raise Exception(f"Container stopped unexpectedly. Logs:\n{logs}")
+            while time.time() - start_time < timeout:
+                try:
+                    # Probe multiple endpoints concurrently; the first response wins
+                    futures = {
+                        probe_executor.submit(self.http.get, f"{base_url}{endpoint}", timeout=0.5): endpoint
+                        for endpoint in ['/health', '/docs', '/']
+                    }
+                    for future in as_completed(futures, timeout=1.0):
+                        try:
+                            response = future.result()
+                            # Any response (even 404) means server is running
+                            if response.status_code in [200, 404, 405]:
+                                logger.info("Server is ready (checked %s)", futures[future])
+                                return base_url
+                        except requests.exceptions.RequestException as e:
+                            last_error = str(e)
+                            continue
+                except Exception as e:
+                    last_error = str(e)
+                finally:
+                    # Drop probes of this round that haven't started yet
+                    for future in futures:
+                        future.cancel()
+                
+                # Check if container is still running, but not on every probe
+                if last_error and attempt % 5 == 0:
+                    container.reload()
+                    if container.status != 'running':
+                        log_thread.join(timeout=1)
+                        logs = ''.join(log_tail)
+                        raise Exception(f"Container stopped unexpectedly. Logs:\n{logs}")
+                
+                time.sleep(_backoff_delay(attempt))
+                attempt += 1
             
-            time.sleep(1)
+            # Get container logs for debugging
+            logs = ''.join(log_tail)
+            raise Exception(
+                f"Server did not become ready within {timeout} seconds. "
+                f"Last error: {last_error}\nContainer logs:\n{logs}"
+            )
+        finally:
+            probe_executor.shutdown(wait=False, cancel_futures=True)
+            # Only needed while waiting; don't hold a thread and a daemon
+            # connection for the lifetime of a warm container
+            stop_logs()
+    
+    def _tail_logs(self, container, max_lines: int = 200):
+        """
+        Stream a container's logs into a bounded buffer from a background thread.
+        
+        The thread ends when the container stops or the returned stop function
+        is called, which closes the log stream.
         
-        # Get container logs for debugging
-        logs = container.logs().decode('utf-8')
-        raise Exception(
-            f"Server did not become ready within {timeout} seconds. "
-            f"Last error: {last_error}\nContainer logs:\n{logs}"
+        Args:
+            container: The Docker container object
+            max_lines: Number of most recent log chunks to keep
+            
+        Returns:
+            Tuple of (buffer, thread, stop function)
+        """
+        log_tail = deque(maxlen=max_lines)
+        stopped = threading.Event()
+        streams = []
+        
+        def follow():
+            try:
+                stream = container.logs(stream=True, follow=True)
+                streams.append(stream)
+                # stop() may have run before the stream was opened
+                if stopped.is_set():
+                    stream.close()
+                    return
+                for chunk in stream:
+                    log_tail.append(chunk.decode('utf-8', errors='replace'))
+            except Exception as e:
+                logger.debug("Stopped following logs of %s: %s", container.id[:12], e)
+        
+        def stop():
+            stopped.set()
+            for stream in streams:
+                stream.close()
+        
+        log_thread = threading.Thread(
+            target=follow,
+            name=f"logs-{container.id[:12]}",
+            daemon=True
         )
+        log_thread.start()
+        return log_tail, log_thread, stop
     
-    def _make_inference_request(self, base_url: str, input_data: Dict[str, Any]) -> Any:
+    def _make_inference_request(self, docker_image: str, base_url: str,
+                                input_data: Dict[str, Any]) -> Any:
         """
         Make HTTP request to the model server for inference.
         
+        Model servers that implement POST /predict_sync?wait=N return the result
+        inline when the prediction finishes within N seconds, or 202 when it is
+        still running. Otherwise the prediction is started with POST /predict and
+        its progress is followed via GET /status. Model servers may support long-polling by holding
+        GET /status?wait=N open for up to N seconds until the prediction finishes;
+        servers that answer 400/404/422 to the parameter are polled with
+        exponential backoff instead.
+        
         Args:
+            docker_image: The image the server runs, which determines its capabilities
             base_url: The base URL where the server is running
             input_data: Dictionary containing input values
             
@@ -276,72 +724,177 @@ class DockerExecutor:
             The parsed inference result
         """
         try:
+            logger.info("Request payload: %s", input_data)
+            payload = orjson.dumps(input_data, option=orjson.OPT_SERIALIZE_NUMPY)
             
-            # Step 1: POST to /predict to start the prediction
-            logger.info(f"Starting prediction request to {base_url}/predict")
-            logger.info(f"Request payload: {input_data}")
-            
-            response = requests.post(
-                f"{base_url}/predict",
-                json=input_data,
-                headers={'Content-Type': 'application/json'},
-                timeout=30
-            )
+            # Fast path: the server may return the result inline
+            started, finished, result = self._predict_sync(docker_image, base_url, payload)
+            if finished:
+                logger.info("Inference result: %s", result)
+                return result
             
-            # /predict doesn't return data, it just starts the process
-            if response.status_code not in [200, 204]:
-                logger.error(f"Predict request failed: {response.status_code} - {response.text}")
-                raise Exception(f"Prediction request failed: {response.text}")
+            # Step 1: POST to /predict to start the prediction
+            if not started:
+                logger.info("Starting prediction request to %s/predict", base_url)
+                
+                response = self.http.post(
+                    f"{base_url}/predict",
+                    data=payload,
+                    timeout=30
+                )
+                
+                # /predict doesn't return data, it just starts the process, so
+                # the body is only read on failure
+                if response.status_code not in [200, 204]:
+                    logger.error("Predict request failed: %s - %s", response.status_code, response.text)
+                    raise PredictionRequestError(
+                        response.status_code, f"Prediction request failed: {response.text}"
+                    )
             
             logger.info("Prediction started, checking status...")
             
             # Step 2: Poll /status until prediction is complete
             max_wait = 60  # seconds
             start_time = time.time()
+            attempt = 0
             
             while time.time() - start_time < max_wait:
-                status_response = requests.get(f"{base_url}/status", timeout=5)
-                status_response.raise_for_status()
-                status_data = status_response.json()
+                status_response = self._get_status(docker_image, base_url)
+                if status_response.status_code >= 400:
+                    raise Exception(f"Status request failed with HTTP {status_response.status_code}")
+                status_data = orjson.loads(status_response.content)
                 
                 status_id = status_data.get('status')
                 message = status_data.get('message', '')
                 
-                logger.info(f"Status: {status_id} - {message}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Status: %s - %s", status_id, message)
                 
                 if status_id == 3:  # Prediction completed
                     logger.info("Prediction completed successfully")
                     break
                 elif status_id == 4:  # Prediction failed
                     error_msg = status_data.get('message', 'Unknown error')
-                    raise Exception(f"Model prediction failed: {error_msg}")
+                    raise ModelPredictionError(f"Model prediction failed: {error_msg}")
                 
-                time.sleep(1)
+                time.sleep(_backoff_delay(attempt))
+                attempt += 1
             else:
                 raise Exception(f"Prediction did not complete within {max_wait} seconds")
             
             # Step 3: GET /result to retrieve the prediction
-            logger.info(f"Fetching result from {base_url}/result")
-            result_response = requests.get(f"{base_url}/result", timeout=5)
-            result_response.raise_for_status()
-            result = result_response.json()
+            logger.info("Fetching result from %s/result", base_url)
+            result_response = self.http.get(f"{base_url}/result", timeout=5)
+            if result_response.status_code >= 400:
+                raise Exception(f"Result request failed with HTTP {result_response.status_code}")
+            result = orjson.loads(result_response.content)
             
-            logger.info(f"Inference result: {result}")
+            logger.info("Inference result: %s", result)
             return result
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"HTTP error making inference request: {str(e)}")
-            raise Exception(f"Inference request failed: {str(e)}")
+            logger.error("HTTP error making inference request: %s", e)
+            # Chained so callers can tell connection errors apart
+            raise Exception(f"Inference request failed: {str(e)}") from e
             
         except Exception as e:
-            logger.error(f"Error making inference request: {str(e)}")
+            logger.error("Error making inference request: %s", e)
             raise
     
+    def _predict_sync(self, docker_image: str, base_url: str, payload: bytes):
+        """
+        Try to run the prediction through the /predict_sync fast path.
+        
+        Args:
+            docker_image: The image the server runs
+            base_url: The base URL where the server is running
+            payload: The JSON-encoded input
+            
+        Returns:
+            Tuple of (started, finished, result). started is False when the server
+            doesn't support the endpoint; finished is True when result holds the
+            prediction.
+        """
+        if docker_image in self._no_predict_sync:
+            return False, False, None
+        
+        logger.info("Starting prediction request to %s/predict_sync", base_url)
+        try:
+            response = self.http.post(
+                f"{base_url}/predict_sync",
+                params={'wait': PREDICT_SYNC_WAIT_SECONDS},
+                data=payload,
+                timeout=PREDICT_SYNC_WAIT_SECONDS + 1
+            )
+        except requests.exceptions.ReadTimeout:
+            # The prediction was accepted but is taking longer; follow /status.
+            # A ConnectTimeout means the request never reached the server, so
+            # it is raised like any other connection error.
+            return True, False, None
+        
+        if response.status_code in [404, 405]:
+            logger.info("Model server of %s does not support /predict_sync", docker_image)
+            self._no_predict_sync.add(docker_image)
+            return False, False, None
+        
+        if response.status_code == 202:
+            return True, False, None
+        
+        if response.status_code != 200:
+            logger.error("Predict request failed: %s - %s", response.status_code, response.text)
+            raise PredictionRequestError(
+                response.status_code, f"Prediction request failed: {response.text}"
+            )
+        
+        # Only a JSON object with a result follows the /predict_sync contract;
+        # anything else (e.g. a catch-all route) means the endpoint isn't there
+        try:
+            body = orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            body = None
+        if not isinstance(body, dict) or 'result' not in body:
+            logger.info("Model server of %s returned no result from /predict_sync", docker_image)
+            self._no_predict_sync.add(docker_image)
+            return False, False, None
+        
+        return True, True, body['result']
+    
+    def _get_status(self, docker_image: str, base_url: str) -> requests.Response:
+        """
+        Request the prediction status, long-polling when the server supports it.
+        
+        Args:
+            docker_image: The image the server runs
+            base_url: The base URL where the server is running
+            
+        Returns:
+            The /status response
+        """
+        if docker_image not in self._no_long_poll:
+            response = self.http.get(
+                f"{base_url}/status",
+                params={'wait': STATUS_LONG_POLL_SECONDS},
+                timeout=STATUS_LONG_POLL_SECONDS + 1
+            )
+            if response.status_code not in [400, 404, 422]:
+                return response
+            
+            logger.info("Model server of %s does not support long-polling /status", docker_image)
+            self._no_long_poll.add(docker_image)
+        
+        return self.http.get(f"{base_url}/status", timeout=5)
+    
     def cleanup(self):
-        """Clean up Docker resources."""
+        """Clean up Docker resources by draining the warm container pool."""
         try:
-            # Optionally prune unused containers and images
-            # self.client.containers.prune()
-            pass
+            with self._warm_lock:
+                if self._reaper:
+                    self._reaper.cancel()
+                    self._reaper = None
+                warm = list(self._warm.values())
+                self._warm.clear()
+            
+            for container, _, _ in warm:
+                self._stop_container(container)
         except Exception as e:
-            logger.warning(f"Error during cleanup: {str(e)}")
+            logger.warning("Error during cleanup: %s", e)
@@ -4,84 +4,517 @@ Metadata Handler Module
 Handles fetching and parsing model metadata from FAIRmodels.org.
 """
 
+import asyncio
+import hashlib
+import httpx
+import importlib
+import json
+import os
 import requests
+import stat
+import sys
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import logging
-from typing import Dict, List, Optional, Any
+import tempfile
+import threading
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 
+def _select_json_loads() -> Callable[[Any], Any]:
+    """Pick the fastest installed JSON parser that accepts bytes."""
+    for module_name in ('orjson', 'ujson', 'simdjson'):
+        try:
+            return importlib.import_module(module_name).loads
+        except ImportError:
+            continue
+    return json.loads
+
+
+# Resolved once at import time
+_loads = _select_json_loads()
+
+
+def _accept_encoding() -> str:
+    """Advertise Brotli only when a decoder is installed for urllib3/httpx to use."""
+    for module_name in ('brotli', 'brotlicffi'):
+        try:
+            importlib.import_module(module_name)
+            return 'gzip, br'
+        except ImportError:
+            continue
+    return 'gzip'
+
+
+# JSON-LD metadata compresses well, so always ask for a compressed response
+ACCEPT_ENCODING = _accept_encoding()
+
+
+# Declared type names (lowercased) mapped to the variable types used in forms
+_TYPE_MAP = {
+    'categorical': 'categorical',
+    'enum': 'categorical',
+    'choice': 'categorical',
+    'number': 'number',
+    'float': 'number',
+    'double': 'number',
+    'numeric': 'number',
+    'integer': 'integer',
+    'int': 'integer',
+    'boolean': 'boolean',
+    'bool': 'boolean',
+    'text': 'text',
+    'string': 'text',
+}
+
+# FAIRmodels 'Type of input' only decides the type for these
+_INPUT_TYPE_MAP = {
+    name: var_type for name, var_type in _TYPE_MAP.items()
+    if var_type in ('categorical', 'number', 'integer')
+}
+
+# JSON Schema types mapped to variable types
+_SCHEMA_TYPE_MAP = {
+    'number': 'number',
+    'integer': 'integer',
+    'boolean': 'boolean',
+    'string': 'text',
+}
+
+# JSON-LD keys of FAIRmodels metadata, interned once at import
+_KEY_GMI = sys.intern('General Model Information')
+_KEY_INPUT_DATA1 = sys.intern('Input data1')
+_KEY_VALUE = sys.intern('@value')
+_KEY_RDFS_LABEL = sys.intern('rdfs:label')
+_KEY_TITLE = sys.intern('Title')
+_KEY_FM_IMAGE = sys.intern('FAIRmodels image name')
+_KEY_INPUT_LABEL = sys.intern('Input label')
+_KEY_INPUT_FEATURE = sys.intern('Input feature')
+_KEY_DESCRIPTION = sys.intern('Description')
+_KEY_TYPE_OF_INPUT = sys.intern('Type of input')
+_KEY_MIN_NUMERICAL = sys.intern('Minimum - for numerical')
+_KEY_MAX_NUMERICAL = sys.intern('Maximum - for numerical')
+_KEY_CATEGORIES = sys.intern('Categories')
+_KEY_CATEGORY_ID = sys.intern('Identification for category used in model')
+_KEY_CATEGORY_LABEL = sys.intern('Category Label')
+
+# Fields that may hold a model's input variables, in order of preference
+_VAR_KEYS = (_KEY_INPUT_DATA1,  # FAIRmodels.org format
+             'Input data', 'variables', 'inputs', 'features', 'parameters')
+
+# Fields holding a model's title in the models list, in order of preference
+_TITLE_KEYS = ('title', 'name', 'label')
+
+# Sentinel for keys that are absent, as opposed to present with a None value
+_MISSING = object()
+
+# Separators replaced by spaces when turning a field name into a label
+_HUMAN_TBL = str.maketrans({'_': ' ', '-': ' '})
+
+
+@lru_cache(maxsize=1024)
+def _humanize(name: str) -> str:
+    """Turn a field name such as 'age_at_diagnosis' into 'Age At Diagnosis'."""
+    return name.translate(_HUMAN_TBL).title()
+
+
+@dataclass(slots=True)
+class Variable:
+    """An input variable of a model, as shown on the inference form."""
+    # Apart from type, fields may hold whatever value the metadata has; a
+    # narrower annotation would be enforced at runtime when compiled by mypyc
+    name: Any
+    label: Any
+    type: str
+    description: Any
+    required: Any = True
+    options: Any = None
+    min: Any = None
+    max: Any = None
+    
+    def __getitem__(self, key: str) -> Any:
+        """Allow dict-style access (variable['name']) for existing callers."""
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key)
+
+
+@dataclass(slots=True)
+class ParsedMetadata:
+    """Name, Docker image and input variables extracted from model metadata."""
+    name: str
+    docker_image: Any
+    variables: List[Variable]
+
+
+# Failures after which the on-disk copy of a response is used instead; a 4xx
+# answer is never one of them
+_UNAVAILABLE_ERRORS = (
+    requests.exceptions.ConnectionError,
+    requests.exceptions.Timeout,
+    requests.exceptions.RetryError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+)
+
+
+# Process-wide HTTP session, shared by all handlers so they reuse connections
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared FAIRmodels session, creating it on first use."""
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            session.headers.update({
+                'Accept': 'application/ld+json',
+                'Accept-Encoding': ACCEPT_ENCODING
+            })
+            # Enough keep-alive connections for concurrent batch fetches; also
+            # retry the gateway errors a busy FAIRmodels server answers with
+            session.mount('https://', HTTPAdapter(
+                pool_connections=32,
+                pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[502, 503, 504])
+            ))
+            _SESSION = session
+        return _SESSION
+
+
+def _default_cache_dir() -> Optional[str]:
+    """
+    Create the current user's metadata cache directory in the temp directory.
+    
+    Cached metadata decides which Docker image is run, so the directory is only
+    used if it belongs to the current user and nobody else can access it.
+    
+    Returns:
+        The directory, or None (disabling the disk cache) if it is not private
+    """
+    if not hasattr(os, 'getuid'):
+        # The temp directory is already per user on Windows
+        return os.path.join(tempfile.gettempdir(), 'fairmodels-metadata')
+    
+    uid = os.getuid()
+    path = os.path.join(tempfile.gettempdir(), f'fairmodels-metadata-{uid}')
+    try:
+        os.mkdir(path, stat.S_IRWXU)
+    except FileExistsError:
+        pass
+    except OSError as e:
+        logger.warning("Could not create metadata cache directory %s: %s", path, e)
+        return None
+    
+    try:
+        # Undo a umask that left us without access; fails if someone else owns it
+        os.chmod(path, stat.S_IRWXU)
+    except OSError:
+        pass
+    
+    try:
+        st = os.lstat(path)
+    except OSError as e:
+        logger.warning("Could not access metadata cache directory %s: %s", path, e)
+        return None
+    if (st.st_uid != uid or not stat.S_ISDIR(st.st_mode)
+            or stat.S_IMODE(st.st_mode) != stat.S_IRWXU):
+        logger.warning("Not using metadata cache directory %s: it is not private to this user", path)
+        return None
+    return path
+
+
+# Derived, ready-to-render information about a model
+ModelInfo = namedtuple('ModelInfo', ['metadata', 'name', 'docker_image', 'variables', 'variable_types'])
+
+
 class MetadataHandler:
     """Handles fetching and parsing model metadata from FAIRmodels.org."""
     
     BASE_URL = "https://v3.fairmodels.org/instance/"
     LIST_URL = "https://v3.fairmodels.org/"
     
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Accept': 'application/ld+json'
-        })
+    def __init__(self, cache_ttl: float = 300, cache_dir: Optional[str] = None) -> None:
+        self.session = _get_session()
+        
+        # model_id -> (expiry, metadata) and model_id -> (expiry, ModelInfo)
+        self.cache_ttl = cache_ttl
+        self._metadata_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._info_cache: Dict[str, Tuple[float, ModelInfo]] = {}
+        self._list_cache: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # model_id -> (ETag, metadata); outlives the TTL so a 304 skips re-parsing
+        self._parsed_metadata: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        
+        # Responses are also kept on disk and revalidated with ETag/Last-Modified;
+        # None disables the disk cache
+        self.cache_dir: Optional[str] = (
+            cache_dir
+            or os.environ.get('METADATA_CACHE_DIR')
+            or _default_cache_dir()
+        )
+    
+    def _cache_get(self, cache: Dict[str, Tuple[float, Any]], key: str) -> Any:
+        """Return a cached value if present and not expired, else None."""
+        with self._cache_lock:
+            entry = cache.get(key)
+            if entry is None:
+                return None
+            expiry, value = entry
+            if time.monotonic() >= expiry:
+                del cache[key]
+                return None
+            return value
+    
+    def _cache_put(self, cache: Dict[str, Tuple[float, Any]], key: str, value: Any) -> None:
+        """Store a value in the given cache with the configured TTL."""
+        with self._cache_lock:
+            cache[key] = (time.monotonic() + self.cache_ttl, value)
+    
+    def _disk_cache_path(self, cache_dir: str, url: str) -> str:
+        """Return the on-disk cache file for a URL."""
+        return os.path.join(cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest())
     
-    def fetch_models_list(self) -> List[Dict[str, Any]]:
+    def _read_disk_cache(self, url: str) -> Tuple[Dict[str, Optional[str]], Optional[bytes]]:
         """
-        Fetch the list of available models from FAIRmodels.org.
+        Read a cached response from disk.
         
         Returns:
-            List of model dictionaries with id and metadata
+            Tuple of (validators, body); validators is empty and body None if not cached
         """
+        if self.cache_dir is None:
+            return {}, None
+        try:
+            with open(self._disk_cache_path(self.cache_dir, url), 'rb') as f:
+                header, _, body = f.read().partition(b'\n')
+            return _loads(header), body
+        except (OSError, ValueError):
+            return {}, None
+    
+    def _write_disk_cache(self, url: str, response: Any) -> None:
+        """
+        Atomically store a response body with its ETag/Last-Modified on disk.
+        
+        Accepts both requests and httpx responses.
+        """
+        cache_dir = self.cache_dir
+        if cache_dir is None:
+            return
+        validators = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified')
+        }
+        try:
+            os.makedirs(cache_dir, mode=stat.S_IRWXU, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(json.dumps(validators).encode('utf-8') + b'\n' + response.content)
+            os.replace(tmp_path, self._disk_cache_path(cache_dir, url))
+        except OSError as e:
+            logger.warning("Could not write metadata cache for %s: %s", url, e)
+    
+    def _conditional_request(self, url: str) -> Tuple[Optional[bytes], Dict[str, str]]:
+        """
+        Look up the on-disk copy of a URL and build revalidation headers for it.
+        
+        Returns:
+            Tuple of (cached body or None, request headers)
+        """
+        validators, cached_body = self._read_disk_cache(url)
+        headers: Dict[str, str] = {}
+        if cached_body is not None:
+            etag = validators.get('etag')
+            if etag:
+                headers['If-None-Match'] = etag
+            last_modified = validators.get('last_modified')
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        return cached_body, headers
+    
+    def _use_stale(self, url: str, parse: Callable[[bytes, Optional[str]], Any],
+                   cached_body: Optional[bytes], cached_etag: Optional[str],
+                   error: Exception) -> Any:
+        """Parse the on-disk copy of a URL after a failed request, or raise the error if there is none."""
+        if cached_body is None:
+            raise error
+        logger.warning("Using cached copy of %s: %s", url, error)
+        return parse(cached_body, cached_etag)
+    
+    def _use_response(self, url: str, parse: Callable[[bytes, Optional[str]], Any],
+                      cached_body: Optional[bytes], cached_etag: Optional[str],
+                      response: Any) -> Any:
+        """
+        Parse the response to a conditional request, falling back to the on-disk copy.
+        
+        On 304 Not Modified the cached body is used. It is also used when the server
+        answers with a 5xx error or sends a body that does not parse, but never after
+        a 4xx error: the model was then withdrawn or access to it was blocked. A new
+        body is only written to disk once it has parsed.
+        
+        Accepts both requests and httpx responses.
+        
+        Returns:
+            The parsed body
+        """
+        if response.status_code == 304 and cached_body is not None:
+            logger.info("Cached copy of %s is still valid", url)
+            return parse(cached_body, cached_etag)
         try:
-            logger.info(f"Fetching models list from {self.LIST_URL}")
-            response = self.session.get(self.LIST_URL, timeout=10)
             response.raise_for_status()
+        except (requests.exceptions.HTTPError, httpx.HTTPStatusError) as e:
+            if response.status_code < 500:
+                raise
+            return self._use_stale(url, parse, cached_body, cached_etag, e)
+        
+        try:
+            parsed = parse(response.content, response.headers.get('ETag'))
+        except ValueError as e:
+            return self._use_stale(url, parse, cached_body, cached_etag, e)
+        self._write_disk_cache(url, response)
+        return parsed
+    
+    def _get_cached(self, url: str, parse: Callable[[bytes, Optional[str]], Any]) -> Any:
+        """
+        GET and parse a URL, revalidating the on-disk copy with a conditional request.
+        
+        The on-disk copy is also used when the server cannot be reached; see
+        _use_response for how the response is handled.
+        
+        Args:
+            url: The URL to fetch
+            parse: Called with the body and its ETag (or None) to parse the body
             
-            models_data = response.json()
-            logger.info(f"Successfully fetched models list")
+        Returns:
+            The parsed body
+        """
+        cached_body, headers = self._conditional_request(url)
+        cached_etag = headers.get('If-None-Match')
+        
+        try:
+            response = self.session.get(url, headers=headers, timeout=10)
+        except _UNAVAILABLE_ERRORS as e:
+            return self._use_stale(url, parse, cached_body, cached_etag, e)
+        return self._use_response(url, parse, cached_body, cached_etag, response)
+    
+    async def _aget_cached(self, client: httpx.AsyncClient, url: str,
+                           parse: Callable[[bytes, Optional[str]], Any]) -> Any:
+        """
+        Asynchronous version of _get_cached.
+        
+        Disk access and parsing run in a worker thread, so they overlap with
+        other requests on the event loop.
+        """
+        cached_body, headers = await asyncio.to_thread(self._conditional_request, url)
+        cached_etag = headers.get('If-None-Match')
+        
+        try:
+            response = await client.get(url, headers=headers)
+        except _UNAVAILABLE_ERRORS as e:
+            return await asyncio.to_thread(self._use_stale, url, parse, cached_body, cached_etag, e)
+        return await asyncio.to_thread(
+            self._use_response, url, parse, cached_body, cached_etag, response
+        )
+    
+    def _load_metadata(self, model_id: str, body: bytes, etag: Optional[str]) -> Dict[str, Any]:
+        """
+        Parse a metadata response body, reusing the previous parse if the ETag is unchanged.
+        
+        Args:
+            model_id: The unique identifier for the model
+            body: The response body
+            etag: The ETag the body was served with, if any
+            
+        Returns:
+            Dictionary containing the model metadata
+        """
+        if etag:
+            with self._cache_lock:
+                entry = self._parsed_metadata.get(model_id)
+            if entry is not None and entry[0] == etag:
+                return entry[1]
+        
+        metadata = _loads(body)
+        if etag:
+            with self._cache_lock:
+                self._parsed_metadata[model_id] = (etag, metadata)
+        return metadata
+    
+    def fetch_models_list(self, include_raw: bool = False) -> List[Dict[str, Any]]:
+        """
+        Fetch the list of available models from FAIRmodels.org.
+        
+        Args:
+            include_raw: Whether to include each model's full list entry under 'raw'
             
+        Returns:
+            List of model dictionaries with id and title (and raw entry if requested)
+        """
+        cache_key = 'raw' if include_raw else 'titles'
+        cached = self._cache_get(self._list_cache, cache_key)
+        if cached is not None:
+            return cached
+        
+        try:
+            logger.info("Fetching models list from %s", self.LIST_URL)
             # Parse the response - API returns dict where keys are UUIDs
-            models = []
-            if isinstance(models_data, dict):
-                for model_id, model_info in models_data.items():
-                    if isinstance(model_info, dict):
-                        # Extract title from top-level or properties
-                        title = model_info.get('title')
-                        if not title and 'properties' in model_info:
-                            props = model_info['properties']
-                            title = props.get('General Model Information.Title')
-                        
-                        if not title:
-                            title = model_id  # Fallback to ID
-                        
-                        models.append({
-                            'id': model_id,
-                            'title': title,
-                            'raw': model_info
-                        })
+            models_data = self._get_cached(self.LIST_URL, lambda body, _: _loads(body))
+            logger.info("Successfully fetched models list")
             
-            logger.info(f"Parsed {len(models)} models from list")
+            items = models_data.items() if isinstance(models_data, dict) else []
+            
+            models: List[Dict[str, Any]] = []
+            for model_id, model_info in items:
+                if isinstance(model_info, dict):
+                    # Extract title from top-level or properties
+                    title = model_info.get('title')
+                    if not title and 'properties' in model_info:
+                        props = model_info['properties']
+                        title = props.get('General Model Information.Title')
+                    
+                    if not title:
+                        title = model_id  # Fallback to ID
+                    
+                    model = {'id': model_id, 'title': title}
+                    if include_raw:
+                        model['raw'] = model_info
+                    models.append(model)
+            
+            logger.info("Parsed %s models from list", len(models))
+            self._cache_put(self._list_cache, cache_key, models)
             return models
             
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching models list: {str(e)}")
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("Error fetching models list: %s", e)
             return []
     
-    def _extract_title_from_list_item(self, model: Dict[str, Any]) -> str:
+    def _extract_title_from_list_item(self, model: Dict[str, Any]) -> Any:
         """Extract title from a model list item."""
         # Try various possible title fields
-        for field in ['title', 'name', 'label']:
-            if field in model:
-                title = model[field]
+        for field in _TITLE_KEYS:
+            title = model.get(field, _MISSING)
+            if title is not _MISSING:
                 if isinstance(title, dict):
-                    return title.get('@value', str(title))
+                    return title.get(_KEY_VALUE, str(title))
                 return str(title)
         
         # Try nested General Model Information
-        if 'General Model Information' in model:
-            info = model['General Model Information']
+        if _KEY_GMI in model:
+            info = model[_KEY_GMI]
             if isinstance(info, dict):
-                title = info.get('Title', {})
+                title = info.get(_KEY_TITLE, {})
                 if isinstance(title, dict):
-                    return title.get('@value', '')
+                    return title.get(_KEY_VALUE, '')
         
         return "Unknown Model"
     
@@ -95,20 +528,202 @@ class MetadataHandler:
         Returns:
             Dictionary containing the model metadata, or None if fetch fails
         """
+        cached = self._cache_get(self._metadata_cache, model_id)
+        if cached is not None:
+            return cached
+        
         url = f"{self.BASE_URL}{model_id}"
         
         try:
-            logger.info(f"Fetching metadata from {url}")
-            response = self.session.get(url, timeout=10)
-            response.raise_for_status()
+            logger.info("Fetching metadata from %s", url)
+            metadata = self._get_cached(
+                url, lambda body, etag: self._load_metadata(model_id, body, etag)
+            )
+            logger.info("Successfully fetched metadata for model %s", model_id)
+            self._cache_put(self._metadata_cache, model_id, metadata)
+            return metadata
+        
+        except (requests.exceptions.RequestException, ValueError) as e:
+            logger.error("Error fetching metadata for %s: %s", model_id, e)
+            return None
+    
+    def fetch_metadata_batch(self, model_ids: List[str],
+                             max_workers: int = 16) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch metadata for several models concurrently.
+        
+        Args:
+            model_ids: The unique identifiers of the models
+            max_workers: Maximum number of concurrent requests
             
-            metadata = response.json()
-            logger.info(f"Successfully fetched metadata for model {model_id}")
+        Returns:
+            Dictionary mapping each model ID to its metadata, or None if the fetch failed
+        """
+        if not model_ids:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(model_ids))) as executor:
+            return dict(zip(model_ids, executor.map(self.fetch_metadata, model_ids)))
+    
+    def _async_client(self) -> httpx.AsyncClient:
+        """Create an HTTP/2 client that multiplexes requests over one connection."""
+        return httpx.AsyncClient(
+            http2=True,
+            headers={'Accept': 'application/ld+json', 'Accept-Encoding': ACCEPT_ENCODING},
+            timeout=10
+        )
+    
+    async def afetch_metadata(self, model_id: str,
+                              client: Optional[httpx.AsyncClient] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fetch model metadata asynchronously over HTTP/2.
+        
+        Uses the same memory and disk caches as fetch_metadata.
+        
+        Args:
+            model_id: The unique identifier for the model
+            client: Client to send the request with; a new one is created if omitted
+            
+        Returns:
+            Dictionary containing the model metadata, or None if fetch fails
+        """
+        cached = self._cache_get(self._metadata_cache, model_id)
+        if cached is not None:
+            return cached
+        
+        if client is None:
+            async with self._async_client() as client:
+                return await self.afetch_metadata(model_id, client)
+        
+        url = f"{self.BASE_URL}{model_id}"
+        
+        try:
+            logger.info("Fetching metadata from %s", url)
+            metadata = await self._aget_cached(
+                client, url, lambda body, etag: self._load_metadata(model_id, body, etag)
+            )
+            logger.info("Successfully fetched metadata for model %s", model_id)
+            self._cache_put(self._metadata_cache, model_id, metadata)
             return metadata
         
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching metadata for {model_id}: {str(e)}")
+        except (httpx.HTTPError, ValueError) as e:
+            logger.error("Error fetching metadata for %s: %s", model_id, e)
+            return None
+    
+    async def afetch_many(self, model_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """
+        Fetch metadata for several models concurrently over a shared HTTP/2 connection.
+        
+        Args:
+            model_ids: The unique identifiers of the models
+            
+        Returns:
+            Dictionary mapping each model ID to its metadata, or None if the fetch failed
+        """
+        async with self._async_client() as client:
+            results = await asyncio.gather(
+                *(self.afetch_metadata(model_id, client) for model_id in model_ids)
+            )
+        return dict(zip(model_ids, results))
+    
+    def get_model_info(self, model_id: str) -> Optional[ModelInfo]:
+        """
+        Fetch metadata and extract name, Docker image and variables in one go.
+        
+        The result is cached per model so repeated form views and submissions
+        do not re-walk the metadata.
+        
+        Args:
+            model_id: The unique identifier for the model
+            
+        Returns:
+            A ModelInfo tuple, or None if the metadata could not be fetched
+        """
+        cached = self._cache_get(self._info_cache, model_id)
+        if cached is not None:
+            return cached
+        
+        metadata = self.fetch_metadata(model_id)
+        if not metadata:
+            return None
+        
+        parsed = self.parse_metadata(metadata)
+        info = ModelInfo(
+            metadata=metadata,
+            name=parsed.name,
+            docker_image=parsed.docker_image,
+            variables=parsed.variables,
+            variable_types={var.name: var.type for var in parsed.variables}
+        )
+        self._cache_put(self._info_cache, model_id, info)
+        return info
+    
+    def get_docker_image_by_id(self, model_id: str) -> Optional[str]:
+        """
+        Get the Docker image of a model without extracting its variables.
+        
+        Uses cached model info when available, otherwise the (cached) metadata.
+        
+        Args:
+            model_id: The unique identifier for the model
+            
+        Returns:
+            The Docker image URL or None
+        """
+        info = self._cache_get(self._info_cache, model_id)
+        if info is not None:
+            return info.docker_image
+        
+        metadata = self.fetch_metadata(model_id)
+        if not metadata:
             return None
+        return self.get_docker_image(metadata)
+    
+    @staticmethod
+    def _unwrap(value: Any, default: Any = '') -> Any:
+        """
+        Unwrap a JSON-LD value object ({'@value': ...}) to its plain value.
+        
+        Args:
+            value: A value object or a plain value
+            default: Returned for None or a value object without '@value'
+        """
+        if type(value) is dict:
+            return value.get(_KEY_VALUE, default)
+        return value if value is not None else default
+    
+    def parse_metadata(self, metadata: Dict[str, Any]) -> ParsedMetadata:
+        """
+        Extract the model name, Docker image and variables in one pass.
+        
+        Args:
+            metadata: The model metadata dictionary
+            
+        Returns:
+            The parsed metadata
+        """
+        if self._is_fairmodels_shape(metadata):
+            # Known FAIRmodels layout: read the fields directly and only fall
+            # back to the generic lookups for values that turn out empty
+            general_info = metadata[_KEY_GMI]
+            source = metadata[_KEY_INPUT_DATA1]
+            return ParsedMetadata(
+                name=self._fast_model_name(general_info) or self._fallback_model_name(metadata),
+                docker_image=(self._fast_docker_image(general_info)
+                              or self._fallback_docker_image(metadata)),
+                variables=(source and self._parse_variables(source)) or self.extract_variables(metadata)
+            )
+        
+        return ParsedMetadata(
+            name=self.get_model_name(metadata),
+            docker_image=self.get_docker_image(metadata),
+            variables=self.extract_variables(metadata)
+        )
+    
+    @staticmethod
+    def _is_fairmodels_shape(metadata: Dict[str, Any]) -> bool:
+        """Check whether metadata follows the FAIRmodels.org JSON-LD layout."""
+        return isinstance(metadata.get(_KEY_GMI), dict) and _KEY_INPUT_DATA1 in metadata
     
     def get_model_name(self, metadata: Dict[str, Any]) -> str:
         """
@@ -120,18 +735,23 @@ class MetadataHandler:
         Returns:
             The model name or a default value
         """
-        # Check FAIRmodels format first
-        if 'General Model Information' in metadata:
-            general_info = metadata['General Model Information']
-            if isinstance(general_info, dict):
-                title = general_info.get('Title', {})
-                if isinstance(title, dict):
-                    title_value = title.get('@value', '')
-                    if title_value:
-                        return title_value
-                elif title:
-                    return str(title)
+        # Check FAIRmodels format first; anything but a dict there lacks .get()
+        try:
+            title = self._fast_model_name(metadata[_KEY_GMI])
+        except (KeyError, AttributeError):
+            title = None
+        if title:
+            return title
         
+        return self._fallback_model_name(metadata)
+    
+    def _fast_model_name(self, general_info: Any) -> Optional[str]:
+        """Read the model name from FAIRmodels General Model Information."""
+        title = self._unwrap(general_info.get(_KEY_TITLE))
+        return str(title) if title else None
+    
+    def _fallback_model_name(self, metadata: Dict[str, Any]) -> str:
+        """Look for the model name in the generic metadata fields."""
         # Try different possible fields for the name
         for field in ['name', 'title', 'label', '@id']:
             if field in metadata:
@@ -139,7 +759,7 @@ class MetadataHandler:
         
         return "Unknown Model"
     
-    def get_docker_image(self, metadata: Dict[str, Any]) -> Optional[str]:
+    def get_docker_image(self, metadata: Dict[str, Any]) -> Any:
         """
         Extract the Docker image URL from metadata.
         
@@ -149,40 +769,49 @@ class MetadataHandler:
         Returns:
             The Docker image URL or None
         """
-        # Check FAIRmodels format first
-        if 'General Model Information' in metadata:
-            general_info = metadata['General Model Information']
-            if isinstance(general_info, dict):
-                fairmodels_image = general_info.get('FAIRmodels image name', {})
-                if isinstance(fairmodels_image, dict):
-                    image_name = fairmodels_image.get('@value', '')
-                    if image_name:
-                        return image_name
-                elif fairmodels_image:
-                    return fairmodels_image
-        
-        # Look for Docker image in various possible locations
-        if 'implementation' in metadata:
-            impl = metadata['implementation']
-            if isinstance(impl, dict) and 'dockerImage' in impl:
-                return impl['dockerImage']
-            elif isinstance(impl, str):
+        # Check FAIRmodels format first; anything but a dict there lacks .get()
+        try:
+            image_name = self._fast_docker_image(metadata[_KEY_GMI])
+        except (KeyError, AttributeError):
+            image_name = None
+        if image_name:
+            return image_name
+        
+        return self._fallback_docker_image(metadata)
+    
+    def _fast_docker_image(self, general_info: Any) -> Any:
+        """Read the Docker image from FAIRmodels General Model Information."""
+        return self._unwrap(general_info.get(_KEY_FM_IMAGE)) or None
+    
+    def _fallback_docker_image(self, metadata: Dict[str, Any]) -> Any:
+        """Look for the Docker image in the generic metadata fields."""
+        # Look for Docker image in various possible locations; these are usually
+        # objects, and indexing anything else raises TypeError
+        impl: Any = metadata.get('implementation')
+        try:
+            return impl['dockerImage']
+        except KeyError:
+            pass
+        except TypeError:
+            if isinstance(impl, str):
                 return impl
         
         if 'dockerImage' in metadata:
             return metadata['dockerImage']
         
-        if 'container' in metadata:
-            container = metadata['container']
-            if isinstance(container, dict) and 'image' in container:
-                return container['image']
-            elif isinstance(container, str):
+        container: Any = metadata.get('container')
+        try:
+            return container['image']
+        except KeyError:
+            pass
+        except TypeError:
+            if isinstance(container, str):
                 return container
         
         logger.warning("Docker image not found in metadata")
         return None
     
-    def extract_variables(self, metadata: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def extract_variables(self, metadata: Dict[str, Any]) -> List[Variable]:
         """
         Extract input variables from metadata.
         
@@ -192,112 +821,92 @@ class MetadataHandler:
         Returns:
             List of variable definitions with name, type, constraints, etc.
         """
-        variables = []
-        
-        # Look for variables in different possible locations
-        var_sources = [
-            metadata.get('Input data1', []),  # FAIRmodels.org format
-            metadata.get('Input data', []),
-            metadata.get('variables', []),
-            metadata.get('inputs', []),
-            metadata.get('features', []),
-            metadata.get('parameters', [])
-        ]
-        
-        for source in var_sources:
+        # Look for variables in different possible locations, in order of
+        # preference; the first one that yields variables is used
+        for key in _VAR_KEYS:
+            source = metadata.get(key)
             if source:
-                variables.extend(self._parse_variables(source))
+                variables = self._parse_variables(source)
+                if variables:
+                    return variables
         
         # If still no variables found, look in schema
-        if not variables and 'schema' in metadata:
+        if 'schema' in metadata:
             schema = metadata['schema']
             if isinstance(schema, dict) and 'properties' in schema:
-                variables = self._parse_schema_properties(schema['properties'])
+                return self._parse_schema_properties(schema['properties'])
         
-        return variables
+        return []
     
-    def _parse_variables(self, var_list: List[Any]) -> List[Dict[str, Any]]:
+    def _parse_variables(self, var_list: Any) -> List[Variable]:
         """Parse a list of variable definitions."""
-        parsed = []
+        parsed: List[Variable] = []
         
         for var in var_list:
             if not isinstance(var, dict):
                 continue
             
             # Handle FAIRmodels.org format with nested structure
-            input_label = var.get('Input label', {})
-            if isinstance(input_label, dict):
-                input_label = input_label.get('@value', '')
+            input_label = self._unwrap(var.get(_KEY_INPUT_LABEL))
             
-            description_obj = var.get('Description', {})
-            if isinstance(description_obj, dict):
-                description = description_obj.get('@value', '')
+            description_obj = var.get(_KEY_DESCRIPTION, {})
+            if type(description_obj) is dict:
+                description = self._unwrap(description_obj)
             else:
                 description = var.get('description', '')
             
             # Get the feature label for human-readable name
-            input_feature = var.get('Input feature', {})
-            if isinstance(input_feature, dict):
-                rdfs_label = input_feature.get('rdfs:label', {})
-                if isinstance(rdfs_label, dict):
-                    feature_label = rdfs_label.get('@value', '')
-                else:
-                    feature_label = rdfs_label
-            else:
+            try:
+                feature_label = self._unwrap(var[_KEY_INPUT_FEATURE][_KEY_RDFS_LABEL])
+            except (KeyError, TypeError):
                 feature_label = ''
             
-            variable_info = {
-                'name': input_label or var.get('name', var.get('id', 'unknown')),
-                'label': feature_label or self._get_human_readable_name(var),
-                'type': self._determine_variable_type(var),
-                'description': description,
-                'required': var.get('required', True)
-            }
+            variable = Variable(
+                name=input_label or var.get('name', var.get('id', 'unknown')),
+                label=feature_label or self._get_human_readable_name(var),
+                type=self._determine_variable_type(var),
+                description=description,
+                required=var.get('required', True)
+            )
             
             # Add constraints based on type
-            if variable_info['type'] == 'categorical':
-                variable_info['options'] = self._get_categorical_options(var)
-            elif variable_info['type'] in ['number', 'integer']:
-                min_val = var.get('Minimum - for numerical', var.get('minimum', var.get('min')))
-                max_val = var.get('Maximum - for numerical', var.get('maximum', var.get('max')))
+            if variable.type == 'categorical':
+                variable.options = self._get_categorical_options(var)
+            elif variable.type in ['number', 'integer']:
+                min_val = var.get(_KEY_MIN_NUMERICAL, var.get('minimum', var.get('min')))
+                max_val = var.get(_KEY_MAX_NUMERICAL, var.get('maximum', var.get('max')))
                 
-                # Extract @value if it's a dict
-                if isinstance(min_val, dict):
-                    min_val = min_val.get('@value')
-                if isinstance(max_val, dict):
-                    max_val = max_val.get('@value')
-                
-                variable_info['min'] = min_val
-                variable_info['max'] = max_val
+                variable.min = self._unwrap(min_val, None)
+                variable.max = self._unwrap(max_val, None)
             
-            parsed.append(variable_info)
+            parsed.append(variable)
         
         return parsed
     
-    def _parse_schema_properties(self, properties: Dict[str, Any]) -> List[Dict[str, Any]]:
+    def _parse_schema_properties(self, properties: Dict[str, Any]) -> List[Variable]:
         """Parse variables from JSON Schema properties."""
-        variables = []
+        variables: List[Variable] = []
         
         for prop_name, prop_def in properties.items():
             if not isinstance(prop_def, dict):
                 continue
             
-            variable_info = {
-                'name': prop_name,
-                'label': prop_def.get('title', prop_name.replace('_', ' ').title()),
-                'type': self._schema_type_to_variable_type(prop_def.get('type', 'string')),
-                'description': prop_def.get('description', ''),
-                'required': True  # Can be refined based on schema 'required' array
-            }
+            variable = Variable(
+                name=prop_name,
+                label=prop_def.get('title', _humanize(prop_name)),
+                type=self._schema_type_to_variable_type(prop_def.get('type', 'string')),
+                description=prop_def.get('description', ''),
+                required=True  # Can be refined based on schema 'required' array
+            )
             
             if 'enum' in prop_def:
-                variable_info['type'] = 'categorical'
-                variable_info['options'] = prop_def['enum']
-            elif variable_info['type'] in ['number', 'integer']:
-                variable_info['min'] = prop_def.get('minimum')
-                variable_info['max'] = prop_def.get('maximum')
+                variable.type = 'categorical'
+                variable.options = prop_def['enum']
+            elif variable.type in ['number', 'integer']:
+                variable.min = prop_def.get('minimum')
+                variable.max = prop_def.get('maximum')
             
-            variables.append(variable_info)
+            variables.append(variable)
         
         return variables
     
@@ -310,118 +919,91 @@ class MetadataHandler:
         
         # Fall back to formatting the name field
         name = var.get('name', var.get('id', 'unknown'))
-        return name.replace('_', ' ').replace('-', ' ').title()
+        return _humanize(name)
     
     def _determine_variable_type(self, var: Dict[str, Any]) -> str:
         """Determine the variable type (categorical, number, integer, text)."""
         # Check for explicit type in FAIRmodels format
-        type_of_input = var.get('Type of input', {})
-        if isinstance(type_of_input, dict):
-            type_of_input = type_of_input.get('@value', '')
+        type_of_input = self._unwrap(var.get(_KEY_TYPE_OF_INPUT))
         
         if type_of_input:
-            type_of_input = str(type_of_input).lower()
-            if type_of_input in ['categorical', 'enum', 'choice']:
-                return 'categorical'
-            elif type_of_input in ['number', 'float', 'double', 'numeric']:
-                return 'number'
-            elif type_of_input in ['integer', 'int']:
-                return 'integer'
+            mapped_type = _INPUT_TYPE_MAP.get(str(type_of_input).lower())
+            if mapped_type:
+                return mapped_type
         
         # Check for explicit type
-        var_type = var.get('type', '').lower()
-        
-        if var_type in ['categorical', 'enum', 'choice']:
-            return 'categorical'
-        elif var_type in ['number', 'float', 'double', 'numeric']:
-            return 'number'
-        elif var_type in ['integer', 'int']:
-            return 'integer'
-        elif var_type in ['boolean', 'bool']:
-            return 'boolean'
-        elif var_type in ['text', 'string']:
-            return 'text'
-        
-        # Infer from presence of min/max (check this BEFORE categories)
-        if 'Minimum - for numerical' in var or 'Maximum - for numerical' in var:
-            # Check if at least one has a non-null value
-            min_val = var.get('Minimum - for numerical', {})
-            max_val = var.get('Maximum - for numerical', {})
-            if isinstance(min_val, dict):
-                min_val = min_val.get('@value')
-            if isinstance(max_val, dict):
-                max_val = max_val.get('@value')
-            
-            if min_val is not None or max_val is not None:
+        mapped_type = _TYPE_MAP.get(var.get('type', '').lower())
+        if mapped_type:
+            return mapped_type
+        
+        # Infer from the shape of the definition. Mapping patterns only accept
+        # literal keys, so the _KEY_* constants are spelled out here. Each key
+        # gets its own case: mypyc only checks the last alternative of an
+        # or-pattern of mappings.
+        match var:
+            # FAIRmodels min/max, if at least one has a non-null value (checked
+            # before categories); an absent key unwraps to None as well
+            case {} if (
+                self._unwrap(var.get(_KEY_MIN_NUMERICAL), None) is not None
+                or self._unwrap(var.get(_KEY_MAX_NUMERICAL), None) is not None
+            ):
                 return 'number'
-        
-        if 'minimum' in var or 'maximum' in var or 'min' in var or 'max' in var:
-            return 'number'
-        
-        # Infer from presence of non-empty Categories
-        if 'Categories' in var and isinstance(var['Categories'], list):
-            # Check if Categories has valid entries (not just empty/null)
-            valid_categories = False
-            for cat in var['Categories']:
-                if isinstance(cat, dict):
-                    identification = cat.get('Identification for category used in model', {})
-                    if isinstance(identification, dict):
-                        identification = identification.get('@value')
-                    if identification is not None:
-                        valid_categories = True
-                        break
-            if valid_categories:
+            case {'minimum': _}:
+                return 'number'
+            case {'maximum': _}:
+                return 'number'
+            case {'min': _}:
+                return 'number'
+            case {'max': _}:
+                return 'number'
+            # Non-empty Categories, i.e. at least one entry with an identification
+            case {'Categories': list(categories)} if any(
+                isinstance(cat, dict) and self._unwrap(cat.get(_KEY_CATEGORY_ID), None) is not None
+                for cat in categories
+            ):
+                return 'categorical'
+            case {'options': _}:
+                return 'categorical'
+            case {'enum': _}:
+                return 'categorical'
+            case {'choices': _}:
                 return 'categorical'
-        
-        # Infer from presence of options/enum
-        if 'options' in var or 'enum' in var or 'choices' in var:
-            return 'categorical'
         
         # Default to text
         return 'text'
     
     def _schema_type_to_variable_type(self, schema_type: str) -> str:
         """Convert JSON Schema type to variable type."""
-        mapping = {
-            'number': 'number',
-            'integer': 'integer',
-            'boolean': 'boolean',
-            'string': 'text'
-        }
-        return mapping.get(schema_type.lower(), 'text')
+        return _SCHEMA_TYPE_MAP.get(schema_type.lower(), 'text')
     
     def _get_categorical_options(self, var: Dict[str, Any]) -> List[Any]:
         """Extract categorical options from variable definition."""
+        # Bind keys and the unwrap helper to locals for the per-category loop
+        id_key = _KEY_CATEGORY_ID
+        label_key = _KEY_CATEGORY_LABEL
+        rdfs_key = _KEY_RDFS_LABEL
+        unwrap = self._unwrap
+        
         # Handle FAIRmodels.org Categories format
-        if 'Categories' in var and isinstance(var['Categories'], list):
-            options = []
-            for category in var['Categories']:
-                if not isinstance(category, dict):
-                    continue
-                
-                # Get the identification value (what the model expects)
-                identification = category.get('Identification for category used in model', {})
-                if isinstance(identification, dict):
-                    identification = identification.get('@value', '')
-                
-                # Get the category label (human-readable)
-                category_label = category.get('Category Label', {})
-                if isinstance(category_label, dict):
-                    rdfs_label = category_label.get('rdfs:label', {})
-                    if isinstance(rdfs_label, dict):
-                        label = rdfs_label.get('@value', '')
-                    else:
-                        label = rdfs_label
-                else:
-                    label = ''
-                
-                # Use identification value for the option, with label as display
-                if identification:
-                    # Store as dict with both value and label for better display
-                    options.append({
-                        'value': identification,
-                        'label': label if label else identification
-                    })
+        categories = var.get(_KEY_CATEGORIES)
+        if isinstance(categories, list):
+            # Identification value (what the model expects) and raw category label
+            entries = [
+                (unwrap(category.get(id_key)), category.get(label_key))
+                for category in categories
+                if type(category) is dict
+            ]
+            
+            # Use identification value for the option, with the human-readable
+            # label as display text
+            options = [
+                {
+                    'value': identification,
+                    'label': (unwrap(label.get(rdfs_key)) if type(label) is dict else '') or identification
+                }
+                for identification, label in entries
+                if identification
+            ]
             
             if options:
                 return options